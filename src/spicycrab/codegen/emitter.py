@@ -3557,7 +3557,6 @@ class RustEmitter:
             # Handle indexed args
             # {argN} - substitute directly
             # {&argN} - substitute with .to_string() stripped (for &str parameters)
-            replacements = {f"arg{i}": arg for i, arg in enumerate(args)}
             # First handle {&argN} syntax - strip .to_string() for &str args
             for i, arg in enumerate(args):
                 ref_placeholder = f"{{&arg{i}}}"
@@ -3568,8 +3567,8 @@ class RustEmitter:
                         stripped_arg = arg[:-12]  # Remove .to_string()
                     rust_code = rust_code.replace(ref_placeholder, stripped_arg)
             # Then handle regular {argN} placeholders
-            for key, val in replacements.items():
-                rust_code = rust_code.replace(f"{{{key}}}", val)
+            for i, arg in enumerate(args):
+                rust_code = rust_code.replace(f"{{arg{i}}}", arg)
 
         # Track required imports
         for imp in mapping.rust_imports:
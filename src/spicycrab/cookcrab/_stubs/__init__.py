@@ -0,0 +1,86 @@
+"""Hardcoded per-crate stubs for things the Rust parser cannot see.
+
+Each module in this package covers one crate (``actix-web`` lives in
+``actix_web``) and exports four tables:
+
+- TYPE_STUBS: type_name -> (class_code, rust_type, {python_suffix: rust_code | ConstructorStub})
+- FUNCTION_STUBS: function_name -> FunctionStub
+- METHOD_STUBS: "Type.method" -> MethodStub
+- MACRO_STUBS: list of (python_stub, toml_mapping)
+
+Modules are imported lazily by ``generator.get_crate_stubs`` so only the
+crate being generated is ever loaded.
+
+Stub code (class_code, stub_code, python_stub) is opaque text that is
+copied into the generated ``__init__.py``. It is never executed here, so
+names like ``Generic`` and ``TypeVar`` it uses need no runtime imports.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+
+class FunctionStub(NamedTuple):
+    """A hardcoded standalone function stub."""
+
+    stub_code: str
+    rust_code: str
+    rust_imports: tuple[str, ...]
+    is_async: bool
+
+
+class ConstructorStub(NamedTuple):
+    """A hardcoded type constructor that needs imports or typed parameters.
+
+    Plain rust_code strings cover constructors that work from their full
+    path alone; this is for the ones that don't (e.g., trait methods).
+    """
+
+    rust_code: str
+    rust_imports: tuple[str, ...]
+    param_types: tuple[str, ...] = ()
+
+
+class MethodStub(NamedTuple):
+    """A hardcoded instance method stub.
+
+    rust_code uses {self} for receiver and {arg0}, {arg1} etc for arguments.
+    param_types lists the Rust type of each parameter (used to transform args,
+    e.g., &str prevents .to_string()).
+    """
+
+    rust_code: str
+    returns_self: bool
+    needs_result: bool
+    returns_type: str | None
+    param_types: tuple[str, ...] | None
+
+
+def build_enum_stub(
+    class_name: str,
+    class_doc: str,
+    rust_path: str,
+    variants: tuple[tuple[str, str], ...],
+) -> tuple[str, str, dict[str, str]]:
+    """Build a TYPE_STUBS entry for a fieldless Rust enum.
+
+    Each variant becomes a static constructor on the Python class and a
+    function mapping to the corresponding Rust enum variant.
+
+    Args:
+        class_name: Python class name (same as the Rust enum name)
+        class_doc: Class docstring body, indented for the class scope
+        rust_path: Full Rust path of the enum
+        variants: (variant_name, docstring) pairs
+
+    Returns:
+        (class_code, rust_type, {python_suffix: rust_code, ...})
+    """
+    methods = "".join(
+        f'\n    @staticmethod\n    def {name}() -> "{class_name}":\n        """{doc}"""\n        ...\n'
+        for name, doc in variants
+    )
+    class_code = f'\nclass {class_name}:\n    """{class_doc}"""\n{methods}'
+    mappings = {f"{class_name}.{name}": f"{rust_path}::{name}" for name, _ in variants}
+    return class_code, rust_path, mappings
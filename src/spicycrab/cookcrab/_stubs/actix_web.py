@@ -0,0 +1,597 @@
+"""Hardcoded stubs for the actix-web crate."""
+
+from __future__ import annotations
+
+from spicycrab.cookcrab._stubs import FunctionStub, MethodStub
+
+
+TYPE_STUBS: dict[str, tuple[str, str, dict[str, str]]] = {
+    "HttpResponse": (
+        # Class stub for HttpResponse and HttpResponseBuilder
+        '''
+class HttpResponse:
+    """HTTP response type.
+
+    Use the static methods to create responses with specific status codes,
+    then chain builder methods to set body, headers, etc.
+
+    Maps to actix_web::HttpResponse in Rust.
+
+    Example:
+        return HttpResponse.Ok().body("Hello World!")
+        return HttpResponse.Ok().json({"key": "value"})
+        return HttpResponse.NotFound().body("Not found")
+    """
+
+    @staticmethod
+    def Ok() -> "HttpResponseBuilder":
+        """Creates a 200 OK response builder."""
+        ...
+
+    @staticmethod
+    def Created() -> "HttpResponseBuilder":
+        """Creates a 201 Created response builder."""
+        ...
+
+    @staticmethod
+    def Accepted() -> "HttpResponseBuilder":
+        """Creates a 202 Accepted response builder."""
+        ...
+
+    @staticmethod
+    def NoContent() -> "HttpResponseBuilder":
+        """Creates a 204 No Content response builder."""
+        ...
+
+    @staticmethod
+    def BadRequest() -> "HttpResponseBuilder":
+        """Creates a 400 Bad Request response builder."""
+        ...
+
+    @staticmethod
+    def Unauthorized() -> "HttpResponseBuilder":
+        """Creates a 401 Unauthorized response builder."""
+        ...
+
+    @staticmethod
+    def Forbidden() -> "HttpResponseBuilder":
+        """Creates a 403 Forbidden response builder."""
+        ...
+
+    @staticmethod
+    def NotFound() -> "HttpResponseBuilder":
+        """Creates a 404 Not Found response builder."""
+        ...
+
+    @staticmethod
+    def InternalServerError() -> "HttpResponseBuilder":
+        """Creates a 500 Internal Server Error response builder."""
+        ...
+
+
+class HttpResponseBuilder:
+    """Builder for constructing HTTP responses.
+
+    Returned by HttpResponse status methods. Chain methods to configure
+    the response body, headers, and content type.
+    """
+
+    def body(self, data: str) -> "HttpResponse":
+        """Set the response body as a string."""
+        ...
+
+    def json(self, data: object) -> "HttpResponse":
+        """Set the response body as JSON."""
+        ...
+
+    def content_type(self, ct: str) -> "HttpResponseBuilder":
+        """Set the Content-Type header."""
+        ...
+
+    def insert_header(self, header: tuple[str, str]) -> "HttpResponseBuilder":
+        """Insert a custom header."""
+        ...
+
+    def finish(self) -> "HttpResponse":
+        """Finish building and return the response."""
+        ...
+''',
+        # Type mapping
+        "actix_web::HttpResponse",
+        # Function mappings for static constructors
+        {
+            "HttpResponse.Ok": "actix_web::HttpResponse::Ok()",
+            "HttpResponse.Created": "actix_web::HttpResponse::Created()",
+            "HttpResponse.Accepted": "actix_web::HttpResponse::Accepted()",
+            "HttpResponse.NoContent": "actix_web::HttpResponse::NoContent()",
+            "HttpResponse.BadRequest": "actix_web::HttpResponse::BadRequest()",
+            "HttpResponse.Unauthorized": "actix_web::HttpResponse::Unauthorized()",
+            "HttpResponse.Forbidden": "actix_web::HttpResponse::Forbidden()",
+            "HttpResponse.NotFound": "actix_web::HttpResponse::NotFound()",
+            "HttpResponse.InternalServerError": "actix_web::HttpResponse::InternalServerError()",
+        },
+    ),
+    "App": (
+        # Class stub for App builder
+        '''
+class App:
+    """Application builder for configuring actix-web services.
+
+    Create with App.new(), then chain methods to add routes, middleware,
+    and application data.
+
+    Maps to actix_web::App in Rust.
+
+    Example:
+        app = App.new().app_data(Data.new(state)).service(handler)
+    """
+
+    @staticmethod
+    def new() -> "App":
+        """Create a new application builder."""
+        ...
+
+    def app_data(self, data: object) -> "App":
+        """Set application-wide shared data.
+
+        Data is wrapped in web::Data<T> and can be extracted in handlers.
+        """
+        ...
+
+    def service(self, handler: object) -> "App":
+        """Register an HTTP service (handler function)."""
+        ...
+
+    def route(self, path: str, route: object) -> "App":
+        """Configure a route for a specific path and method."""
+        ...
+
+    def wrap(self, middleware: object) -> "App":
+        """Wrap the application with middleware."""
+        ...
+
+    def configure(self, f: object) -> "App":
+        """Run external configuration as part of application building."""
+        ...
+''',
+        # Type mapping
+        "actix_web::App",
+        # Function mappings
+        {
+            "App.new": "actix_web::App::new()",
+        },
+    ),
+    "HttpServer": (
+        # Class stub for HttpServer
+        '''
+class HttpServer:
+    """HTTP server that manages worker threads and connections.
+
+    Create with HttpServer.new() passing an App factory, then configure
+    bindings and run the server.
+
+    Maps to actix_web::HttpServer in Rust.
+
+    Example:
+        HttpServer.new(lambda: App.new().service(index))
+            .bind("127.0.0.1:8080")
+            .run()
+    """
+
+    @staticmethod
+    def new(factory: object) -> "HttpServer":
+        """Create a new HTTP server with an application factory.
+
+        The factory is called for each worker thread to create the App.
+        """
+        ...
+
+    def bind(self, addr: str) -> "HttpServer":
+        """Bind to a socket address (e.g., "127.0.0.1:8080")."""
+        ...
+
+    def bind_rustls(self, addr: str, config: object) -> "HttpServer":
+        """Bind with TLS using rustls."""
+        ...
+
+    def workers(self, num: int) -> "HttpServer":
+        """Set the number of worker threads (default: number of CPUs)."""
+        ...
+
+    async def run(self) -> None:
+        """Start the server and wait for it to finish."""
+        ...
+''',
+        # Type mapping
+        "actix_web::HttpServer",
+        # Function mappings (static constructors only, methods go in METHOD_STUBS)
+        {
+            "HttpServer.new": "actix_web::HttpServer::new(move || {arg0})",
+        },
+    ),
+    "Data": (
+        # Class stub for web::Data (shared application state)
+        '''
+class Data(Generic[T]):
+    """Shared application state extractor.
+
+    Wraps data in Arc for thread-safe sharing between handlers.
+    Register with App.app_data() and extract in handler parameters.
+
+    Maps to actix_web::web::Data<T> in Rust.
+
+    Example:
+        # In main:
+        state = Data.new(AppState())
+        app = App.new().app_data(state)
+
+        # In handler:
+        async def index(data: Data[AppState]) -> HttpResponse:
+            return HttpResponse.Ok().body(data.app_name)
+    """
+
+    @staticmethod
+    def new(value: T) -> "Data[T]":
+        """Create new shared application data."""
+        ...
+''',
+        # Type mapping
+        "actix_web::web::Data",
+        # Function mappings
+        {
+            "Data.new": "actix_web::web::Data::new({arg0})",
+        },
+    ),
+    "Query": (
+        # Class stub for web::Query (query string extractor)
+        '''
+class Query(Generic[T]):
+    """Query string parameter extractor.
+
+    Extracts typed data from the URL query string.
+    The type T must implement serde::Deserialize.
+
+    Maps to actix_web::web::Query<T> in Rust.
+
+    Example:
+        @dataclass
+        class Params:
+            name: str
+            page: int
+
+        async def search(params: Query[Params]) -> HttpResponse:
+            return HttpResponse.Ok().body(f"Searching for {params.name}")
+    """
+    pass
+''',
+        # Type mapping
+        "actix_web::web::Query",
+        # No static constructors
+        {},
+    ),
+    "Json": (
+        # Class stub for web::Json (JSON extractor/responder)
+        '''
+class Json(Generic[T]):
+    """JSON extractor and responder.
+
+    As extractor: Deserializes JSON request body into type T.
+    As responder: Serializes type T to JSON response.
+
+    Maps to actix_web::web::Json<T> in Rust.
+
+    Example:
+        @dataclass
+        class User:
+            name: str
+            email: str
+
+        async def create_user(user: Json[User]) -> Json[User]:
+            # user.name, user.email are accessible
+            return Json(user)
+    """
+
+    def __init__(self, value: T) -> None:
+        """Create a JSON response from a value."""
+        ...
+''',
+        # Type mapping
+        "actix_web::web::Json",
+        # No static constructors
+        {},
+    ),
+    "Form": (
+        # Class stub for web::Form (form data extractor)
+        '''
+class Form(Generic[T]):
+    """URL-encoded form data extractor.
+
+    Extracts typed data from application/x-www-form-urlencoded request body.
+    The type T must implement serde::Deserialize.
+
+    Maps to actix_web::web::Form<T> in Rust.
+
+    Example:
+        @dataclass
+        class LoginForm:
+            username: str
+            password: str
+
+        async def login(form: Form[LoginForm]) -> HttpResponse:
+            # form.username, form.password are accessible
+            return HttpResponse.Ok().body("Logged in")
+    """
+    pass
+''',
+        # Type mapping
+        "actix_web::web::Form",
+        # No static constructors
+        {},
+    ),
+    "Path": (
+        # Class stub for web::Path (path parameter extractor)
+        '''
+class Path(Generic[T]):
+    """Path parameter extractor.
+
+    Extracts typed data from URL path segments.
+    The type T must implement serde::Deserialize.
+
+    Maps to actix_web::web::Path<T> in Rust.
+
+    Example:
+        # Route: /users/{user_id}
+        async def get_user(path: Path[int]) -> HttpResponse:
+            user_id = path.into_inner()
+            return HttpResponse.Ok().body(f"User {user_id}")
+
+        # Multiple params: /users/{user_id}/posts/{post_id}
+        @dataclass
+        class PathParams:
+            user_id: int
+            post_id: int
+
+        async def get_post(path: Path[PathParams]) -> HttpResponse:
+            return HttpResponse.Ok().body(f"Post {path.post_id}")
+    """
+
+    def into_inner(self) -> T:
+        """Extract the inner value."""
+        ...
+''',
+        # Type mapping
+        "actix_web::web::Path",
+        # No static constructors
+        {},
+    ),
+    "HttpRequest": (
+        # Class stub for HttpRequest
+        '''
+class HttpRequest:
+    """HTTP request type.
+
+    Contains request metadata like method, URI, headers, etc.
+    Can be extracted in handlers when you need low-level access.
+
+    Maps to actix_web::HttpRequest in Rust.
+
+    Example:
+        async def handler(req: HttpRequest) -> HttpResponse:
+            method = req.method()
+            path = req.path()
+            return HttpResponse.Ok().body(f"{method} {path}")
+    """
+
+    def method(self) -> str:
+        """Get the HTTP method."""
+        ...
+
+    def uri(self) -> str:
+        """Get the request URI."""
+        ...
+
+    def path(self) -> str:
+        """Get the URL path."""
+        ...
+
+    def query_string(self) -> str:
+        """Get the raw query string."""
+        ...
+
+    def headers(self) -> object:
+        """Get request headers."""
+        ...
+''',
+        # Type mapping
+        "actix_web::HttpRequest",
+        # No static constructors
+        {},
+    ),
+    "Route": (
+        # Class stub for web::Route (route configuration)
+        '''
+class Route:
+    """Route configuration for HTTP method handlers.
+
+    Created by web::get(), web::post(), etc. functions.
+    Use .to() to attach a handler function.
+
+    Maps to actix_web::web::Route in Rust.
+
+    Example:
+        # Register a GET route
+        app = App.new().route("/", get().to(index))
+
+        # Register a POST route
+        app = App.new().route("/submit", post().to(submit_handler))
+    """
+
+    def to(self, handler: object) -> "Route":
+        """Attach a handler function to this route.
+
+        The handler must be an async function that returns an HttpResponse
+        or impl Responder.
+        """
+        ...
+''',
+        # Type mapping
+        "actix_web::web::Route",
+        # No static constructors (instance method to() is in METHOD_STUBS)
+        {},
+    ),
+}
+
+FUNCTION_STUBS: dict[str, FunctionStub] = {
+    # =========================================================================
+    # actix-web error functions
+    # =========================================================================
+    "ErrorBadRequest": FunctionStub(
+        stub_code='''
+def ErrorBadRequest(msg: str) -> object:
+    """Create a 400 Bad Request error.
+
+    Use in handlers to return an error response.
+
+    Example:
+        if not valid:
+            return Err(ErrorBadRequest("Invalid input"))
+    """
+    ...
+''',
+        rust_code="actix_web::error::ErrorBadRequest({arg0})",
+        rust_imports=("actix_web::error",),
+        is_async=False,
+    ),
+    "ErrorUnauthorized": FunctionStub(
+        stub_code='''
+def ErrorUnauthorized(msg: str) -> object:
+    """Create a 401 Unauthorized error."""
+    ...
+''',
+        rust_code="actix_web::error::ErrorUnauthorized({arg0})",
+        rust_imports=("actix_web::error",),
+        is_async=False,
+    ),
+    "ErrorForbidden": FunctionStub(
+        stub_code='''
+def ErrorForbidden(msg: str) -> object:
+    """Create a 403 Forbidden error."""
+    ...
+''',
+        rust_code="actix_web::error::ErrorForbidden({arg0})",
+        rust_imports=("actix_web::error",),
+        is_async=False,
+    ),
+    "ErrorNotFound": FunctionStub(
+        stub_code='''
+def ErrorNotFound(msg: str) -> object:
+    """Create a 404 Not Found error."""
+    ...
+''',
+        rust_code="actix_web::error::ErrorNotFound({arg0})",
+        rust_imports=("actix_web::error",),
+        is_async=False,
+    ),
+    "ErrorInternalServerError": FunctionStub(
+        stub_code='''
+def ErrorInternalServerError(msg: str) -> object:
+    """Create a 500 Internal Server Error."""
+    ...
+''',
+        rust_code="actix_web::error::ErrorInternalServerError({arg0})",
+        rust_imports=("actix_web::error",),
+        is_async=False,
+    ),
+    "get": FunctionStub(
+        stub_code='''
+def get() -> object:
+    """Create a GET route configuration.
+
+    Use with App.route() to configure a GET endpoint.
+
+    Example:
+        App.new().route("/", get().to(handler))
+    """
+    ...
+''',
+        rust_code="actix_web::web::get()",
+        rust_imports=(),  # No import needed - using fully-qualified path
+        is_async=False,
+    ),
+    "post": FunctionStub(
+        stub_code='''
+def post() -> object:
+    """Create a POST route configuration."""
+    ...
+''',
+        rust_code="actix_web::web::post()",
+        rust_imports=(),  # No import needed - using fully-qualified path
+        is_async=False,
+    ),
+    "put": FunctionStub(
+        stub_code='''
+def put() -> object:
+    """Create a PUT route configuration."""
+    ...
+''',
+        rust_code="actix_web::web::put()",
+        rust_imports=(),  # No import needed - using fully-qualified path
+        is_async=False,
+    ),
+    "delete": FunctionStub(
+        stub_code='''
+def delete() -> object:
+    """Create a DELETE route configuration."""
+    ...
+''',
+        rust_code="actix_web::web::delete()",
+        rust_imports=(),  # No import needed - using fully-qualified path
+        is_async=False,
+    ),
+    "patch": FunctionStub(
+        stub_code='''
+def patch() -> object:
+    """Create a PATCH route configuration."""
+    ...
+''',
+        rust_code="actix_web::web::patch()",
+        rust_imports=(),  # No import needed - using fully-qualified path
+        is_async=False,
+    ),
+}
+
+METHOD_STUBS: dict[str, MethodStub] = {
+    # actix-web HttpServer methods
+    "HttpServer.bind": MethodStub(
+        rust_code="{self}.bind({arg0}).unwrap()",  # bind returns Result, unwrap it
+        returns_self=True,
+        needs_result=False,  # needs_result (we already unwrap)
+        returns_type=None,
+        param_types=("&str",),  # param_types: bind takes &str address
+    ),
+    "HttpServer.run": MethodStub(
+        rust_code="{self}.run().await",  # run() returns Server, need .await
+        returns_self=False,
+        needs_result=False,
+        returns_type=None,
+        param_types=None,
+    ),
+    # actix-web App methods
+    "App.route": MethodStub(
+        rust_code="{self}.route({arg0}, {arg1})",
+        returns_self=True,  # returns_self for chaining
+        needs_result=False,
+        returns_type=None,
+        param_types=("&str",),  # param_types: route takes &str path, then Route
+    ),
+    # actix-web Route methods
+    "Route.to": MethodStub(
+        rust_code="{self}.to({arg0})",
+        returns_self=True,  # returns_self for chaining
+        needs_result=False,
+        returns_type=None,
+        param_types=None,
+    ),
+}
+
+MACRO_STUBS: list[tuple[str, dict]] = []
@@ -0,0 +1,58 @@
+"""Hardcoded stubs for the base64 crate."""
+
+from __future__ import annotations
+
+from spicycrab.cookcrab._stubs import FunctionStub, MethodStub
+
+
+TYPE_STUBS: dict[str, tuple[str, str, dict[str, str]]] = {}
+
+FUNCTION_STUBS: dict[str, FunctionStub] = {}
+
+METHOD_STUBS: dict[str, MethodStub] = {
+    # base64 Engine trait method
+    "URL_SAFE_NO_PAD.decode": MethodStub(
+        rust_code="base64::engine::general_purpose::URL_SAFE_NO_PAD.decode({arg0})",
+        returns_self=False,
+        needs_result=True,  # needs_result - decode returns Result
+        returns_type="Vec<u8>",
+        param_types=("&[u8]",),
+    ),
+    "STANDARD.decode": MethodStub(
+        rust_code="base64::engine::general_purpose::STANDARD.decode({arg0})",
+        returns_self=False,
+        needs_result=True,
+        returns_type="Vec<u8>",
+        param_types=("&[u8]",),
+    ),
+    "STANDARD_NO_PAD.decode": MethodStub(
+        rust_code="base64::engine::general_purpose::STANDARD_NO_PAD.decode({arg0})",
+        returns_self=False,
+        needs_result=True,
+        returns_type="Vec<u8>",
+        param_types=("&[u8]",),
+    ),
+    "URL_SAFE.decode": MethodStub(
+        rust_code="base64::engine::general_purpose::URL_SAFE.decode({arg0})",
+        returns_self=False,
+        needs_result=True,
+        returns_type="Vec<u8>",
+        param_types=("&[u8]",),
+    ),
+    "URL_SAFE_NO_PAD.encode": MethodStub(
+        rust_code="base64::engine::general_purpose::URL_SAFE_NO_PAD.encode({arg0})",
+        returns_self=False,
+        needs_result=False,  # needs_result - encode returns String
+        returns_type="String",
+        param_types=("&[u8]",),
+    ),
+    "STANDARD.encode": MethodStub(
+        rust_code="base64::engine::general_purpose::STANDARD.encode({arg0})",
+        returns_self=False,
+        needs_result=False,
+        returns_type="String",
+        param_types=("&[u8]",),
+    ),
+}
+
+MACRO_STUBS: list[tuple[str, dict]] = []
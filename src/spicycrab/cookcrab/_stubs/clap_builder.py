@@ -0,0 +1,120 @@
+"""Hardcoded stubs for the clap_builder crate."""
+
+from __future__ import annotations
+
+from spicycrab.cookcrab._stubs import FunctionStub, MethodStub, build_enum_stub
+
+
+TYPE_STUBS: dict[str, tuple[str, str, dict[str, str]]] = {
+    "ArgAction": build_enum_stub(
+        "ArgAction",
+        """Behavior of arguments when they are encountered while parsing.
+
+    Maps to clap::builder::ArgAction in Rust.
+
+    Common variants:
+    - SetTrue: Flag that sets to true when present
+    - SetFalse: Flag that sets to false when present
+    - Set: Store a single value (default)
+    - Append: Collect multiple values
+    - Count: Count occurrences
+
+    Example:
+        cmd.arg(Arg.new("verbose").short("v").action(ArgAction.SetTrue()))
+    """,
+        "clap_builder::ArgAction",
+        (
+            ("SetTrue", "Flag that sets to true when present."),
+            ("SetFalse", "Flag that sets to false when present."),
+            ("Set", "Store a single value (default behavior)."),
+            ("Append", "Collect multiple occurrences into a Vec."),
+            ("Count", "Count the number of occurrences."),
+            ("Help", "Print help and exit."),
+            ("Version", "Print version and exit."),
+        ),
+    ),
+    "ValueHint": build_enum_stub(
+        "ValueHint",
+        """Provide shell completion hints for argument values.
+
+    Maps to clap::builder::ValueHint in Rust.
+
+    Example:
+        cmd.arg(Arg.new("file").value_hint(ValueHint.FilePath()))
+    """,
+        "clap_builder::ValueHint",
+        (
+            ("Unknown", "Unknown hint (default)."),
+            ("Other", "Other type."),
+            ("AnyPath", "Any path (file or directory)."),
+            ("FilePath", "Path to a file."),
+            ("DirPath", "Path to a directory."),
+            ("ExecutablePath", "Path to an executable."),
+            ("CommandName", "Command name."),
+            ("CommandString", "Command string."),
+            ("CommandWithArguments", "Command with arguments."),
+            ("Username", "Username."),
+            ("Hostname", "Hostname."),
+            ("Url", "URL."),
+            ("EmailAddress", "Email address."),
+        ),
+    ),
+}
+
+FUNCTION_STUBS: dict[str, FunctionStub] = {}
+
+METHOD_STUBS: dict[str, MethodStub] = {
+    # clap_builder ArgMatches methods - need special handling for return types
+    # (clap re-exports from clap_builder, so methods are defined there)
+    "ArgMatches.get_many": MethodStub(
+        rust_code="{self}.get_many::<String>({arg0}).map(|v| v.cloned().collect::<Vec<_>>()).unwrap_or_default()",
+        returns_self=False,
+        needs_result=False,
+        returns_type="Vec<String>",
+        param_types=("&str",),
+    ),
+    "ArgMatches.get_one": MethodStub(
+        rust_code="{self}.get_one::<String>({arg0}).cloned()",
+        returns_self=False,
+        needs_result=False,
+        returns_type="Option<String>",
+        param_types=("&str",),
+    ),
+    "ArgMatches.subcommand_name": MethodStub(
+        rust_code="{self}.subcommand_name().map(|s| s.to_string())",
+        returns_self=False,
+        needs_result=False,
+        returns_type="Option<String>",
+        param_types=None,
+    ),
+    "ArgMatches.get_flag": MethodStub(
+        rust_code="{self}.get_flag({arg0})",
+        returns_self=False,
+        needs_result=False,
+        returns_type="bool",
+        param_types=("&str",),
+    ),
+    "ArgMatches.get_count": MethodStub(
+        rust_code="{self}.get_count({arg0})",
+        returns_self=False,
+        needs_result=False,
+        returns_type="u8",
+        param_types=("&str",),
+    ),
+    "ArgMatches.subcommand": MethodStub(
+        rust_code="{self}.subcommand().map(|(name, matches)| (name.to_string(), matches.clone()))",
+        returns_self=False,
+        needs_result=False,
+        returns_type="Option<(String, ArgMatches)>",
+        param_types=None,
+    ),
+    "ArgMatches.subcommand_matches": MethodStub(
+        rust_code="{self}.subcommand_matches({arg0}).cloned()",
+        returns_self=False,
+        needs_result=False,
+        returns_type="Option<ArgMatches>",
+        param_types=("&str",),
+    ),
+}
+
+MACRO_STUBS: list[tuple[str, dict]] = []
@@ -0,0 +1,75 @@
+"""Hardcoded stubs for the josekit crate."""
+
+from __future__ import annotations
+
+from spicycrab.cookcrab._stubs import FunctionStub, MethodStub
+
+
+TYPE_STUBS: dict[str, tuple[str, str, dict[str, str]]] = {}
+
+FUNCTION_STUBS: dict[str, FunctionStub] = {}
+
+METHOD_STUBS: dict[str, MethodStub] = {
+    # josekit JwtPayload convenience methods
+    "JwtPayload.set_issued_at_now": MethodStub(
+        rust_code="{self}.set_issued_at(&std::time::SystemTime::now())",
+        returns_self=True,  # returns_self for chaining
+        needs_result=False,
+        returns_type=None,
+        param_types=None,
+    ),
+    "JwtPayload.set_expires_at_hours": MethodStub(
+        rust_code=(
+            "{self}.set_expires_at(&(std::time::SystemTime::now() + std::time::Duration::from_secs({arg0} * 3600)))"
+        ),
+        returns_self=True,  # returns_self for chaining
+        needs_result=False,
+        returns_type=None,
+        param_types=("u64",),  # param_types - hours as integer
+    ),
+    # josekit .claim() methods return Option<&Value>, need .cloned() to get owned value
+    "JwtPayload.claim": MethodStub(
+        rust_code="{self}.claim({arg0}).cloned()",
+        returns_self=False,
+        needs_result=False,
+        returns_type="Option<Value>",
+        param_types=("&str",),
+    ),
+    "JwsHeader.claim": MethodStub(
+        rust_code="{self}.claim({arg0}).cloned()",
+        returns_self=False,
+        needs_result=False,
+        returns_type="Option<Value>",
+        param_types=("&str",),
+    ),
+    "JweHeader.claim": MethodStub(
+        rust_code="{self}.claim({arg0}).cloned()",
+        returns_self=False,
+        needs_result=False,
+        returns_type="Option<Value>",
+        param_types=("&str",),
+    ),
+    "JwsHeaderSet.claim": MethodStub(
+        rust_code="{self}.claim({arg0}).cloned()",
+        returns_self=False,
+        needs_result=False,
+        returns_type="Option<Value>",
+        param_types=("&str",),
+    ),
+    "JweHeaderSet.claim": MethodStub(
+        rust_code="{self}.claim({arg0}).cloned()",
+        returns_self=False,
+        needs_result=False,
+        returns_type="Option<Value>",
+        param_types=("&str",),
+    ),
+    "JwtPayloadValidator.claim": MethodStub(
+        rust_code="{self}.claim({arg0}).cloned()",
+        returns_self=False,
+        needs_result=False,
+        returns_type="Option<Value>",
+        param_types=("&str",),
+    ),
+}
+
+MACRO_STUBS: list[tuple[str, dict]] = []
@@ -0,0 +1,45 @@
+"""Hardcoded stubs for the log crate."""
+
+from __future__ import annotations
+
+from spicycrab.cookcrab._stubs import FunctionStub, MethodStub
+
+
+TYPE_STUBS: dict[str, tuple[str, str, dict[str, str]]] = {}
+
+FUNCTION_STUBS: dict[str, FunctionStub] = {}
+
+METHOD_STUBS: dict[str, MethodStub] = {}
+
+# One macro per log level, all taking a single message argument
+_LOG_LEVELS = ("trace", "debug", "info", "warn", "error")
+
+MACRO_STUBS: list[tuple[str, dict]] = [
+    (
+        f'\ndef {level}(message: str) -> None:\n    """Logs a message at the {level} level."""\n    ...\n',
+        {
+            "python": f"log.{level}",
+            "rust_code": f'log::{level}!("{{}}", {{arg0}})',
+            "rust_imports": [],
+            "needs_result": False,
+            "param_types": ["&str"],
+        },
+    )
+    for level in _LOG_LEVELS
+]
+MACRO_STUBS.append(
+    (
+        '''
+def eprintln(message: str) -> None:
+    """Print to stderr."""
+    ...
+''',
+        {
+            "python": "log.eprintln",
+            "rust_code": 'eprintln!("{}", {arg0})',
+            "rust_imports": [],
+            "needs_result": False,
+            "param_types": ["&str"],
+        },
+    )
+)
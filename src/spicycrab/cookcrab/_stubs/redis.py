@@ -0,0 +1,31 @@
+"""Hardcoded stubs for the redis crate."""
+
+from __future__ import annotations
+
+from spicycrab.cookcrab._stubs import FunctionStub, MethodStub
+
+
+TYPE_STUBS: dict[str, tuple[str, str, dict[str, str]]] = {}
+
+FUNCTION_STUBS: dict[str, FunctionStub] = {}
+
+METHOD_STUBS: dict[str, MethodStub] = {
+    # redis Cmd async methods - convenience wrappers that include .await
+    "Cmd.query_async_await": MethodStub(
+        rust_code="{self}.query_async({arg0}).await",
+        returns_self=False,
+        needs_result=True,  # needs_result - adds ? after .await
+        returns_type=None,
+        param_types=("&mut ConnectionManager",),
+    ),
+    # redis Client async methods
+    "Client.get_connection_manager_await": MethodStub(
+        rust_code="{self}.get_connection_manager().await",
+        returns_self=False,
+        needs_result=True,  # needs_result - adds ?
+        returns_type="ConnectionManager",
+        param_types=None,
+    ),
+}
+
+MACRO_STUBS: list[tuple[str, dict]] = []
@@ -0,0 +1,25 @@
+"""Hardcoded stubs for the reqwest crate."""
+
+from __future__ import annotations
+
+from spicycrab.cookcrab._stubs import FunctionStub, MethodStub
+
+
+TYPE_STUBS: dict[str, tuple[str, str, dict[str, str]]] = {}
+
+FUNCTION_STUBS: dict[str, FunctionStub] = {}
+
+METHOD_STUBS: dict[str, MethodStub] = {
+    # reqwest request builders have async send methods with no arguments.
+    # Generic parsing can see multiple cfg-gated impls; keep the public call
+    # shape explicit so generated stubs do not accidentally include {arg0}.
+    "RequestBuilder.send": MethodStub(
+        rust_code="{self}.send()",
+        returns_self=False,
+        needs_result=True,  # needs_result - generated call unwraps/propagates the Result
+        returns_type="Response",
+        param_types=(),
+    ),
+}
+
+MACRO_STUBS: list[tuple[str, dict]] = []
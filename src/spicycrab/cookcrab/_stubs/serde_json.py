@@ -0,0 +1,63 @@
+"""Hardcoded stubs for the serde_json crate."""
+
+from __future__ import annotations
+
+from spicycrab.cookcrab._stubs import FunctionStub, MethodStub
+
+
+TYPE_STUBS: dict[str, tuple[str, str, dict[str, str]]] = {}
+
+FUNCTION_STUBS: dict[str, FunctionStub] = {}
+
+METHOD_STUBS: dict[str, MethodStub] = {
+    # serde_json Value methods that return references - need .cloned() for owned values
+    "Value.as_object": MethodStub(
+        rust_code="{self}.as_object().cloned()",
+        returns_self=False,
+        needs_result=False,
+        returns_type="Option<Map<String, Value>>",
+        param_types=None,
+    ),
+    "Value.as_array": MethodStub(
+        rust_code="{self}.as_array().cloned()",
+        returns_self=False,
+        needs_result=False,
+        returns_type="Option<Vec<Value>>",
+        param_types=None,
+    ),
+    "Value.as_str": MethodStub(
+        rust_code="{self}.as_str().map(|s| s.to_string())",
+        returns_self=False,
+        needs_result=False,
+        returns_type="Option<String>",
+        param_types=None,
+    ),
+    # serde_json Map.get returns Option<&Value>, override with .cloned()
+    "Map.get": MethodStub(
+        rust_code="{self}.get({arg0}).cloned()",
+        returns_self=False,
+        needs_result=False,
+        returns_type="Option<Value>",
+        param_types=("&str",),
+    ),
+}
+
+MACRO_STUBS: list[tuple[str, dict]] = [
+    (
+        '''
+def json(value: Any) -> "Value":
+    """Convert a Python value to a serde_json::Value.
+
+    Uses the serde_json::json! macro.
+    """
+    ...
+''',
+        {
+            "python": "serde_json.json",
+            "rust_code": "serde_json::json!({arg0})",
+            "rust_imports": [],
+            "needs_result": False,
+            "param_types": ["impl Serialize"],
+        },
+    ),
+]
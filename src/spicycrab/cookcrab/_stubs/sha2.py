@@ -0,0 +1,131 @@
+"""Hardcoded stubs for the sha2 crate."""
+
+from __future__ import annotations
+
+from spicycrab.cookcrab._stubs import ConstructorStub, FunctionStub, MethodStub
+
+
+# Sha256 and Sha512 are type aliases, which the parser does not turn into classes
+TYPE_STUBS: dict[str, tuple[str, str, dict[str, str | ConstructorStub]]] = {
+    "Sha256": (
+        '''
+class Sha256:
+    """SHA-256 hasher.
+
+    Maps to sha2::Sha256 in Rust (type alias for CoreWrapper<Sha256VarCore>).
+    """
+
+    @staticmethod
+    def digest(data: bytes) -> bytes:
+        """Compute SHA-256 hash of data in one shot.
+
+        Args:
+            data: Bytes to hash
+
+        Returns:
+            32-byte hash digest
+        """
+        ...
+
+    @staticmethod
+    def new() -> "Sha256":
+        """Create a new SHA-256 hasher."""
+        ...
+
+    def update(self, data: bytes) -> None:
+        """Update the hasher with data."""
+        ...
+
+    def finalize(self) -> bytes:
+        """Finalize and return the hash."""
+        ...
+''',
+        "sha2::Sha256",
+        {
+            "Sha256.digest": ConstructorStub(
+                "sha2::Sha256::digest({arg0})",
+                ("sha2::Sha256", "sha2::Digest"),
+                ("&[u8]",),
+            ),
+            "Sha256.new": ConstructorStub("sha2::Sha256::new()", ("sha2::Sha256", "sha2::Digest")),
+        },
+    ),
+    "Sha512": (
+        '''
+class Sha512:
+    """SHA-512 hasher.
+
+    Maps to sha2::Sha512 in Rust.
+    """
+
+    @staticmethod
+    def digest(data: bytes) -> bytes:
+        """Compute SHA-512 hash of data in one shot."""
+        ...
+
+    @staticmethod
+    def new() -> "Sha512":
+        """Create a new SHA-512 hasher."""
+        ...
+''',
+        "sha2::Sha512",
+        {
+            "Sha512.digest": ConstructorStub(
+                "sha2::Sha512::digest({arg0})",
+                ("sha2::Sha512", "sha2::Digest"),
+                ("&[u8]",),
+            ),
+            "Sha512.new": ConstructorStub("sha2::Sha512::new()", ("sha2::Sha512", "sha2::Digest")),
+        },
+    ),
+}
+
+FUNCTION_STUBS: dict[str, FunctionStub] = {}
+
+METHOD_STUBS: dict[str, MethodStub] = {
+    # sha2 Sha256 instance methods
+    "Sha256.update": MethodStub(
+        rust_code="{self}.update({arg0})",
+        returns_self=True,  # returns_self for chaining
+        needs_result=False,
+        returns_type=None,
+        param_types=("&[u8]",),
+    ),
+    "Sha256.finalize": MethodStub(
+        rust_code="{self}.finalize()",
+        returns_self=False,
+        needs_result=False,
+        returns_type="GenericArray<u8, U32>",  # returns_type (digest output)
+        param_types=None,
+    ),
+    "Sha256.finalize_hex": MethodStub(
+        rust_code='format!("{:x}", {self}.finalize())',
+        returns_self=False,
+        needs_result=False,
+        returns_type="String",
+        param_types=None,
+    ),
+    "Sha512.update": MethodStub(
+        rust_code="{self}.update({arg0})",
+        returns_self=True,  # returns_self for chaining
+        needs_result=False,
+        returns_type=None,
+        param_types=("&[u8]",),
+    ),
+    "Sha512.finalize": MethodStub(
+        rust_code="{self}.finalize()",
+        returns_self=False,
+        needs_result=False,
+        returns_type="GenericArray<u8, U64>",
+        param_types=None,
+    ),
+    "Sha512.finalize_hex": MethodStub(
+        rust_code='format!("{:x}", {self}.finalize())',
+        returns_self=False,
+        needs_result=False,
+        returns_type="String",
+        param_types=None,
+    ),
+}
+
+MACRO_STUBS: list[tuple[str, dict]] = []
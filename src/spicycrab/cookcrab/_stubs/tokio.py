@@ -0,0 +1,474 @@
+"""Hardcoded stubs for the tokio crate."""
+
+from __future__ import annotations
+
+from spicycrab.cookcrab._stubs import FunctionStub, MethodStub
+
+
+TYPE_STUBS: dict[str, tuple[str, str, dict[str, str]]] = {
+    "Duration": (
+        # Class stub
+        '''
+class Duration:
+    """A Duration type representing a span of time.
+
+    Maps to std::time::Duration in Rust.
+    """
+
+    @staticmethod
+    def from_secs(secs: int) -> "Duration":
+        """Creates a new Duration from seconds."""
+        ...
+
+    @staticmethod
+    def from_millis(millis: int) -> "Duration":
+        """Creates a new Duration from milliseconds."""
+        ...
+
+    @staticmethod
+    def from_micros(micros: int) -> "Duration":
+        """Creates a new Duration from microseconds."""
+        ...
+
+    @staticmethod
+    def from_nanos(nanos: int) -> "Duration":
+        """Creates a new Duration from nanoseconds."""
+        ...
+
+    def as_secs(self) -> int:
+        """Returns the number of whole seconds."""
+        ...
+
+    def as_millis(self) -> int:
+        """Returns the total number of milliseconds."""
+        ...
+''',
+        # Type mapping
+        "std::time::Duration",
+        # Function mappings (python_suffix -> rust_code)
+        {
+            "Duration.from_secs": "std::time::Duration::from_secs({arg0} as u64)",
+            "Duration.from_millis": "std::time::Duration::from_millis({arg0} as u64)",
+            "Duration.from_micros": "std::time::Duration::from_micros({arg0} as u64)",
+            "Duration.from_nanos": "std::time::Duration::from_nanos({arg0} as u64)",
+        },
+    ),
+    "Instant": (
+        # Class stub
+        '''
+class Instant:
+    """A measurement of a monotonically nondecreasing clock.
+
+    Maps to tokio::time::Instant in Rust.
+    """
+
+    @staticmethod
+    def now() -> "Instant":
+        """Returns the current instant."""
+        ...
+
+    def elapsed(self) -> Duration:
+        """Returns the time elapsed since this instant."""
+        ...
+''',
+        # Type mapping
+        "tokio::time::Instant",
+        # Function mappings
+        {
+            "Instant.now": "tokio::time::Instant::now()",
+        },
+    ),
+    "MpscSender": (
+        # Class stub for mpsc bounded channel sender
+        '''
+class MpscSender:
+    """Sender half of a bounded mpsc channel.
+
+    Maps to tokio::sync::mpsc::Sender<String> in Rust.
+    Use with mpsc_channel() for type-safe channel creation.
+    """
+
+    async def send(self, value: str) -> None:
+        """Sends a value, waiting until there is capacity."""
+        ...
+
+    def clone(self) -> "MpscSender":
+        """Clones this sender."""
+        ...
+
+    def is_closed(self) -> bool:
+        """Returns True if the receiver has been dropped."""
+        ...
+''',
+        # Type mapping
+        "tokio::sync::mpsc::Sender<String>",
+        # Function mappings - none needed, methods are instance methods
+        {},
+    ),
+    "MpscReceiver": (
+        # Class stub for mpsc bounded channel receiver
+        '''
+class MpscReceiver:
+    """Receiver half of a bounded mpsc channel.
+
+    Maps to tokio::sync::mpsc::Receiver<String> in Rust.
+    Use with mpsc_channel() for type-safe channel creation.
+    """
+
+    async def recv(self) -> str | None:
+        """Receives the next value, or None if the channel is closed."""
+        ...
+
+    def close(self) -> None:
+        """Closes the receiving half without dropping it."""
+        ...
+''',
+        # Type mapping
+        "tokio::sync::mpsc::Receiver<String>",
+        # Function mappings - none needed, methods are instance methods
+        {},
+    ),
+    "Arc": (
+        # Class stub for Arc (thread-safe reference counting)
+        '''
+from typing import TypeVar, Generic
+
+T = TypeVar("T")
+
+
+class Arc(Generic[T]):
+    """Thread-safe reference-counting pointer.
+
+    Arc stands for Atomically Reference Counted. It provides shared ownership
+    of a value of type T, allocated on the heap. Cloning an Arc produces a new
+    Arc that points to the same allocation, increasing the reference count.
+
+    Maps to std::sync::Arc<T> in Rust.
+
+    Common use cases:
+    - Sharing immutable data between spawned tasks
+    - Combined with Mutex for shared mutable state: Arc[Mutex[T]]
+
+    Example:
+        data: Arc[str] = Arc.new("shared config")
+        cloned: Arc[str] = Arc.clone(data)
+
+        # Share between tasks
+        handle1 = spawn(worker(Arc.clone(data)))
+        handle2 = spawn(worker(Arc.clone(data)))
+    """
+
+    @staticmethod
+    def new(value: T) -> "Arc[T]":
+        """Constructs a new Arc<T>.
+
+        Args:
+            value: The value to wrap in an Arc.
+
+        Returns:
+            A new Arc containing the value.
+        """
+        ...
+
+    @staticmethod
+    def clone(arc: "Arc[T]") -> "Arc[T]":
+        """Creates a new Arc that points to the same allocation.
+
+        This increments the strong reference count.
+
+        Args:
+            arc: The Arc to clone.
+
+        Returns:
+            A new Arc pointing to the same data.
+        """
+        ...
+
+    @staticmethod
+    def strong_count(arc: "Arc[T]") -> int:
+        """Gets the number of strong (Arc) pointers to this allocation.
+
+        Args:
+            arc: The Arc to check.
+
+        Returns:
+            The number of strong references.
+        """
+        ...
+
+    @staticmethod
+    def weak_count(arc: "Arc[T]") -> int:
+        """Gets the number of weak (Weak) pointers to this allocation.
+
+        Args:
+            arc: The Arc to check.
+
+        Returns:
+            The number of weak references.
+        """
+        ...
+
+    @staticmethod
+    def try_unwrap(arc: "Arc[T]") -> T | None:
+        """Returns the inner value if the Arc has exactly one strong reference.
+
+        If there are multiple strong references, returns None.
+
+        Args:
+            arc: The Arc to unwrap.
+
+        Returns:
+            The inner value if ref count is 1, otherwise None.
+        """
+        ...
+
+    @staticmethod
+    def into_inner(arc: "Arc[T]") -> T | None:
+        """Returns the inner value if the Arc has exactly one strong reference.
+
+        This is similar to try_unwrap but available on Rust 1.70+.
+
+        Args:
+            arc: The Arc to unwrap.
+
+        Returns:
+            The inner value if ref count is 1, otherwise None.
+        """
+        ...
+''',
+        # Type mapping - generic Arc<T>
+        "std::sync::Arc",
+        # Function mappings for static methods
+        {
+            "Arc.new": "std::sync::Arc::new({arg0})",
+            "Arc.clone": "std::sync::Arc::clone(&{arg0})",
+            "Arc.strong_count": "std::sync::Arc::strong_count(&{arg0})",
+            "Arc.weak_count": "std::sync::Arc::weak_count(&{arg0})",
+            "Arc.try_unwrap": "std::sync::Arc::try_unwrap({arg0}).ok()",
+            "Arc.into_inner": "std::sync::Arc::into_inner({arg0})",
+        },
+    ),
+    "Mutex": (
+        # Class stub for tokio's async Mutex
+        '''
+class Mutex(Generic[T]):
+    """An asynchronous mutual exclusion primitive.
+
+    This is tokio's async-aware Mutex, suitable for use across .await points.
+    Unlike std::sync::Mutex, holding a tokio::sync::Mutex guard across an
+    await point is safe.
+
+    Maps to tokio::sync::Mutex<T> in Rust.
+
+    Common use case - shared mutable state between tasks:
+        counter: Arc[Mutex[int]] = Arc.new(Mutex.new(0))
+
+        async def increment(c: Arc[Mutex[int]]) -> None:
+            guard = await c.lock()
+            # modify the value through the guard
+
+    Example:
+        mutex: Mutex[int] = Mutex.new(0)
+        guard = await mutex.lock()
+    """
+
+    @staticmethod
+    def new(value: T) -> "Mutex[T]":
+        """Creates a new Mutex wrapping the given value.
+
+        Args:
+            value: The value to protect with the mutex.
+
+        Returns:
+            A new Mutex containing the value.
+        """
+        ...
+
+    async def lock(self) -> "MutexGuard[T]":
+        """Locks this mutex, waiting asynchronously if it's already locked.
+
+        Returns:
+            A guard that releases the lock when dropped.
+        """
+        ...
+
+    def try_lock(self) -> "MutexGuard[T] | None":
+        """Attempts to acquire the lock without waiting.
+
+        Returns:
+            A guard if successful, None if the mutex is already locked.
+        """
+        ...
+
+    def is_locked(self) -> bool:
+        """Returns True if the mutex is currently locked.
+
+        Returns:
+            True if locked, False otherwise.
+        """
+        ...
+
+
+class MutexGuard(Generic[T]):
+    """A guard that releases the mutex when dropped.
+
+    This is returned by Mutex.lock() and provides access to the protected data.
+    The lock is automatically released when the guard goes out of scope.
+    """
+    pass
+''',
+        # Type mapping
+        "tokio::sync::Mutex",
+        # Function mappings
+        {
+            "Mutex.new": "tokio::sync::Mutex::new({arg0})",
+        },
+    ),
+    "RwLock": (
+        # Class stub for tokio's async RwLock
+        '''
+class RwLock(Generic[T]):
+    """An asynchronous reader-writer lock.
+
+    This type of lock allows multiple readers or a single writer at any point
+    in time. Useful when you have data that is read frequently but written
+    infrequently.
+
+    Maps to tokio::sync::RwLock<T> in Rust.
+
+    Example:
+        data: RwLock[list[str]] = RwLock.new(["initial"])
+
+        # Multiple readers allowed
+        read_guard = await data.read()
+
+        # Single writer, blocks readers
+        write_guard = await data.write()
+    """
+
+    @staticmethod
+    def new(value: T) -> "RwLock[T]":
+        """Creates a new RwLock wrapping the given value.
+
+        Args:
+            value: The value to protect with the lock.
+
+        Returns:
+            A new RwLock containing the value.
+        """
+        ...
+
+    async def read(self) -> "RwLockReadGuard[T]":
+        """Locks this RwLock for reading, waiting if a writer holds the lock.
+
+        Multiple readers can hold the lock simultaneously.
+
+        Returns:
+            A read guard that releases the lock when dropped.
+        """
+        ...
+
+    async def write(self) -> "RwLockWriteGuard[T]":
+        """Locks this RwLock for writing, waiting if any readers or writers hold the lock.
+
+        Returns:
+            A write guard that releases the lock when dropped.
+        """
+        ...
+
+    def try_read(self) -> "RwLockReadGuard[T] | None":
+        """Attempts to acquire the read lock without waiting.
+
+        Returns:
+            A read guard if successful, None if the lock is held by a writer.
+        """
+        ...
+
+    def try_write(self) -> "RwLockWriteGuard[T] | None":
+        """Attempts to acquire the write lock without waiting.
+
+        Returns:
+            A write guard if successful, None if the lock is held.
+        """
+        ...
+
+
+class RwLockReadGuard(Generic[T]):
+    """A guard that releases the read lock when dropped."""
+    pass
+
+
+class RwLockWriteGuard(Generic[T]):
+    """A guard that releases the write lock when dropped."""
+    pass
+''',
+        # Type mapping
+        "tokio::sync::RwLock",
+        # Function mappings
+        {
+            "RwLock.new": "tokio::sync::RwLock::new({arg0})",
+        },
+    ),
+}
+
+FUNCTION_STUBS: dict[str, FunctionStub] = {
+    "spawn": FunctionStub(
+        stub_code='''
+async def spawn(future: F) -> JoinHandle:
+    """Spawns a new asynchronous task.
+
+    The spawned task may execute on the current thread or another thread.
+    Maps to tokio::spawn in Rust.
+    """
+    ...
+''',
+        rust_code="tokio::spawn({arg0})",
+        rust_imports=(),
+        is_async=True,
+    ),
+    "spawn_blocking": FunctionStub(
+        stub_code='''
+async def spawn_blocking(f: F) -> JoinHandle:
+    """Runs a blocking function on a dedicated thread pool.
+
+    Maps to tokio::task::spawn_blocking in Rust.
+    """
+    ...
+''',
+        rust_code="tokio::task::spawn_blocking({arg0})",
+        rust_imports=("tokio::task::spawn_blocking",),
+        is_async=True,
+    ),
+    "mpsc_channel": FunctionStub(
+        stub_code='''
+def mpsc_channel(buffer: int) -> tuple:
+    """Creates a bounded mpsc channel for communication between tasks.
+
+    Returns a tuple of (Sender, Receiver).
+    Maps to tokio::sync::mpsc::channel in Rust.
+    """
+    ...
+''',
+        rust_code="tokio::sync::mpsc::channel({arg0})",
+        rust_imports=("tokio::sync::mpsc",),
+        is_async=False,
+    ),
+    "mpsc_unbounded_channel": FunctionStub(
+        stub_code='''
+def mpsc_unbounded_channel() -> tuple:
+    """Creates an unbounded mpsc channel for communication between tasks.
+
+    Returns a tuple of (UnboundedSender, UnboundedReceiver).
+    Maps to tokio::sync::mpsc::unbounded_channel in Rust.
+    """
+    ...
+''',
+        rust_code="tokio::sync::mpsc::unbounded_channel()",
+        rust_imports=("tokio::sync::mpsc",),
+        is_async=False,
+    ),
+}
+
+METHOD_STUBS: dict[str, MethodStub] = {}
+
+MACRO_STUBS: list[tuple[str, dict]] = []
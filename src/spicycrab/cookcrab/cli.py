@@ -20,6 +20,7 @@ import sys
 import tarfile
 import tempfile
 import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from urllib.error import HTTPError, URLError
 
@@ -37,6 +38,9 @@ SPICYCRAB_STUBS_REPO = "https://github.com/kushaldas/spicycrab-stubs.git"
 CRATES_IO_API = "https://crates.io/api/v1/crates"
 CRATES_IO_DOWNLOAD = "https://static.crates.io/crates"
 
+# Upper bound on concurrent crates.io downloads for re-exported source crates
+MAX_PARALLEL_DOWNLOADS = 4
+
 
 def fetch_crate_info(crate_name: str) -> dict:
     """Fetch crate information from crates.io API.
@@ -126,6 +130,43 @@ def download_crate(crate_name: str, version: str, output_dir: Path) -> Path:
         raise click.ClickException(f"Failed to extract crate: {e}")
 
 
+def fetch_latest_crate(crate_name: str) -> tuple[str, Path, Path]:
+    """Download the latest stable release of a crate into a fresh temp directory.
+
+    Args:
+        crate_name: Name of the crate
+
+    Returns:
+        Tuple of (version, temp directory, extracted crate directory). The
+        caller owns the temp directory and must remove it.
+
+    Raises:
+        click.ClickException: If fetching, download or extraction fails
+    """
+    crate_info = fetch_crate_info(crate_name)
+    # Prefer stable versions over pre-release
+    version = crate_info.get("max_stable_version") or crate_info.get("max_version", "0.1.0")
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        crate_path = download_crate(crate_name, version, temp_dir)
+    except BaseException:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        raise
+    return version, temp_dir, crate_path
+
+
+def discard_crate_download(download: Future[tuple[str, Path, Path]]) -> None:
+    """Cancel a fetch_latest_crate download, or remove its temp directory once it finishes."""
+
+    def remove_temp_dir(finished: Future[tuple[str, Path, Path]]) -> None:
+        if not finished.cancelled() and finished.exception() is None:
+            shutil.rmtree(finished.result()[1], ignore_errors=True)
+
+    if not download.cancel():
+        download.add_done_callback(remove_temp_dir)
+
+
 def is_uv_available() -> bool:
     """Check if uv is available in the environment."""
     try:
@@ -726,38 +767,48 @@ def generate(
         click.echo("This crate re-exports from other crates. Will generate stubs for source crates.")
     click.echo("")
 
-    # Generate stubs for source crates first (if any)
-    for source_crate in source_crates_to_generate:
+    # Generate stubs for source crates first (if any). Downloads are network
+    # bound, so they all start up front; parsing and generation stay in order.
+    # A crate re-exported more than once is only downloaded and generated once.
+    unique_source_crates = list(dict.fromkeys(source_crates_to_generate))
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_DOWNLOADS) as executor:
+        source_downloads = {}
         if not local:
-            click.echo(f"Generating stubs for source crate: {source_crate}...")
-            try:
-                source_info = fetch_crate_info(source_crate)
-                # Prefer stable versions over pre-release
-                source_version = source_info.get("max_stable_version") or source_info.get("max_version", "0.1.0")
-                click.echo(f"  Version: {source_version}")
-
-                source_temp_dir = Path(tempfile.mkdtemp())
-                source_path = download_crate(source_crate, source_version, source_temp_dir)
-                source_parsed = parse_crate(str(source_path.absolute()))
-
-                click.echo(f"  Found {len(source_parsed.structs)} struct(s)")
-                click.echo(f"  Found {len(source_parsed.impls)} impl block(s)")
-
-                # Generate the source crate stubs
-                from spicycrab.cookcrab.generator import generate_stub_package
-
-                generate_stub_package(
-                    crate=source_parsed,
-                    crate_name=source_crate,
-                    version=source_version,
-                    output_dir=output,
-                )
-                click.echo(f"  Generated: {output / source_crate}")
-
-                shutil.rmtree(source_temp_dir, ignore_errors=True)
-            except Exception as e:
-                click.echo(click.style(f"  Warning: Could not generate {source_crate}: {e}", fg="yellow"))
-        click.echo("")
+            source_downloads = {c: executor.submit(fetch_latest_crate, c) for c in unique_source_crates}
+
+        try:
+            for source_crate in unique_source_crates:
+                if not local:
+                    click.echo(f"Generating stubs for source crate: {source_crate}...")
+                    source_temp_dir = None
+                    try:
+                        source_download = source_downloads.pop(source_crate)
+                        source_version, source_temp_dir, source_path = source_download.result()
+                        click.echo(f"  Version: {source_version}")
+
+                        source_parsed = parse_crate(str(source_path.absolute()))
+
+                        click.echo(f"  Found {len(source_parsed.structs)} struct(s)")
+                        click.echo(f"  Found {len(source_parsed.impls)} impl block(s)")
+
+                        # Generate the source crate stubs
+                        generate_stub_package(
+                            crate=source_parsed,
+                            crate_name=source_crate,
+                            version=source_version,
+                            output_dir=output,
+                        )
+                        click.echo(f"  Generated: {output / source_crate}")
+                    except Exception as e:
+                        click.echo(click.style(f"  Warning: Could not generate {source_crate}: {e}", fg="yellow"))
+                    finally:
+                        if source_temp_dir:
+                            shutil.rmtree(source_temp_dir, ignore_errors=True)
+                click.echo("")
+        finally:
+            # Downloads the loop never reached (e.g. after Ctrl-C) must not leak their temp dirs
+            for source_download in source_downloads.values():
+                discard_crate_download(source_download)
 
     # Generate the stub package
     click.echo("Generating stub package...")
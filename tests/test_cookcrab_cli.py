@@ -4,8 +4,11 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 
-from spicycrab.cookcrab import cli
+from click.testing import CliRunner
+
+from spicycrab.cookcrab import cli, generator
 
 
 def test_uv_build_does_not_use_project_environment(monkeypatch, tmp_path: Path) -> None:
@@ -49,3 +52,54 @@ def test_pip_install_uses_cookcrab_interpreter(monkeypatch) -> None:
     monkeypatch.setattr(cli, "is_uv_available", lambda: False)
 
     assert cli.get_pip_command() == [sys.executable, "-m", "pip", "install"]
+
+
+def test_generate_builds_each_reexported_source_crate_once(monkeypatch, tmp_path: Path) -> None:
+    """Source crates are generated in order, once each, and every download dir is removed."""
+    source_temp_dirs: list[Path] = []
+
+    def fake_fetch_latest_crate(crate_name: str) -> tuple[str, Path, Path]:
+        temp_dir = tmp_path / f"download-{crate_name}-{len(source_temp_dirs)}"
+        crate_path = temp_dir / crate_name
+        crate_path.mkdir(parents=True)
+        source_temp_dirs.append(temp_dir)
+        return "1.0.0", temp_dir, crate_path
+
+    def fake_parse_crate(path: str) -> SimpleNamespace:
+        reexports = [SimpleNamespace(is_glob=True, source_crate=name) for name in ("b_builder", "a_core", "b_builder")]
+        return SimpleNamespace(
+            name=Path(path).name,
+            structs=[],
+            enums=[],
+            functions=[],
+            impls=[],
+            type_aliases=[],
+            reexports=reexports if Path(path).name == "wrapper" else [],
+        )
+
+    def fake_download_crate(crate_name: str, version: str, dest_dir: Path) -> Path:
+        crate_path = dest_dir / crate_name
+        crate_path.mkdir()
+        return crate_path
+
+    generated: list[str] = []
+    reexported: list[list[str]] = []
+    monkeypatch.setattr(cli, "fetch_crate_info", lambda name: {"id": name, "max_stable_version": "2.0.0"})
+    monkeypatch.setattr(cli, "download_crate", fake_download_crate)
+    monkeypatch.setattr(cli, "fetch_latest_crate", fake_fetch_latest_crate)
+    monkeypatch.setitem(sys.modules, "spicycrab.cookcrab._parser", SimpleNamespace(parse_crate=fake_parse_crate))
+    monkeypatch.setattr(generator, "generate_stub_package", lambda crate_name, **kwargs: generated.append(crate_name))
+    monkeypatch.setattr(
+        generator,
+        "generate_reexport_stub_package",
+        lambda source_crates, **kwargs: reexported.append(source_crates),
+    )
+
+    result = CliRunner().invoke(cli.generate, ["wrapper", "-o", str(tmp_path / "out")])
+
+    assert result.exit_code == 0, result.output
+    assert "Could not generate" not in result.output
+    assert generated == ["b_builder", "a_core"]
+    assert len(source_temp_dirs) == 2
+    assert not any(temp_dir.exists() for temp_dir in source_temp_dirs)
+    assert reexported == [["b_builder", "a_core", "b_builder"]]
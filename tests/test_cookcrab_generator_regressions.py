@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import os
+import tomllib
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
@@ -11,7 +14,17 @@ from spicycrab.codegen.cargo import generate_cargo_toml
 from spicycrab.codegen.emitter import RustEmitter
 from spicycrab.codegen.stdlib.types import StdlibMapping
 from spicycrab.codegen.stub_discovery import StubPackage
-from spicycrab.cookcrab.generator import STD_METHOD_STUBS, generate_reexport_toml
+from spicycrab.cookcrab.generator import (
+    _CRATE_MODULES,
+    escape_toml_string,
+    format_rust_imports,
+    generate_init_py,
+    generate_reexport_toml,
+    generate_spicycrab_toml,
+    get_crate_stubs,
+    lookup_method_stub,
+    rust_type_to_python,
+)
 from spicycrab.parser import parse_source
 
 
@@ -49,17 +62,104 @@ rust = "clap_builder::Command"
     assert "clap_builder::Command" not in toml
 
 
+def test_reexport_toml_rereads_regenerated_source(tmp_path: Path) -> None:
+    """Cached source mapping blocks are dropped once the source TOML changes."""
+    source_toml = tmp_path / "clap_builder" / "spicycrab_clap_builder" / "_spicycrab.toml"
+    source_toml.parent.mkdir(parents=True)
+    source_toml.write_text('[[mappings.types]]\npython = "Command"\nrust = "clap_builder::Command"\n')
+    assert 'rust = "clap::Command"' in generate_reexport_toml("clap", ["clap_builder"], "4.6.1", "m", tmp_path)
+
+    source_toml.write_text('[[mappings.types]]\npython = "Arg"\nrust = "clap_builder::Arg"\n')
+    os.utime(source_toml, ns=(0, source_toml.stat().st_mtime_ns + 1))
+    toml = generate_reexport_toml("clap", ["clap_builder"], "4.6.1", "m", tmp_path)
+    assert 'rust = "clap::Arg"' in toml
+    assert "Command" not in toml
+
+
 def test_reqwest_request_builder_send_is_zero_arg_override() -> None:
     """reqwest RequestBuilder.send must stay a zero-argument method mapping."""
-    rust_code, returns_self, needs_result, returns_type, param_types = STD_METHOD_STUBS[
-        ("reqwest", "RequestBuilder", "send")
-    ]
+    stub = lookup_method_stub("reqwest", "RequestBuilder", "send")
+    assert stub is not None
+    rust_code, returns_self, needs_result, returns_type, param_types = stub
 
     assert rust_code == "{self}.send()"
     assert returns_self is False
     assert needs_result is True
     assert returns_type == "Response"
-    assert param_types == []
+    assert param_types == ()
+
+
+def test_crate_stubs_load_only_requested_crate() -> None:
+    """Crates without hardcoded stubs get empty tables, known crates get their own."""
+    assert get_crate_stubs("no-such-crate").method_stubs == {}
+    assert lookup_method_stub("no-such-crate", "Client", "get") is None
+
+    tokio_stubs = get_crate_stubs("tokio")
+    assert "Duration" in tokio_stubs.type_stubs
+    assert "spawn" in tokio_stubs.function_stubs
+    assert get_crate_stubs("tokio") is tokio_stubs
+
+    # Crates without a _stubs module still get their entries from the generator tables
+    assert get_crate_stubs("chrono").trait_method_imports["year"] == "chrono::Datelike"
+    assert get_crate_stubs("chrono").type_stubs == {}
+    assert get_crate_stubs("redis").type_path_overrides["ConnectionManager"] == "redis::aio::ConnectionManager"
+
+
+@pytest.mark.parametrize("crate_name", sorted(_CRATE_MODULES))
+def test_crate_stub_sources_are_valid_python(crate_name: str) -> None:
+    """Hardcoded stub text must parse, since it is pasted into generated packages."""
+    stubs = get_crate_stubs(crate_name)
+    sources = [class_code for class_code, _rust_type, _mappings in stubs.type_stubs.values()]
+    sources += [func_stub.stub_code for func_stub in stubs.function_stubs.values()]
+    sources += [python_stub for python_stub, _mapping in stubs.macro_stubs]
+
+    for source in sources:
+        compile(source, f"<{crate_name} stub>", "exec")
+
+
+def test_sha2_type_stubs_keep_constructor_imports() -> None:
+    """sha2's hasher classes come from its _stubs module with the Digest import they need."""
+    crate = SimpleNamespace(
+        structs=[],
+        enums=[],
+        impls=[],
+        functions=[],
+        type_aliases=[],
+        enum_variant_aliases=[],
+        macros=[],
+        available_features=[],
+        default_features=[],
+    )
+    assert "class Sha256:" in generate_init_py(crate, "sha2")
+
+    toml = tomllib.loads(generate_spicycrab_toml(crate, "sha2", "0.10.8", "spicycrab_sha2"))
+    functions = {mapping["python"]: mapping for mapping in toml["mappings"]["functions"]}
+    digest = functions["sha2.Sha256.digest"]
+    assert digest["rust_imports"] == ["sha2::Sha256", "sha2::Digest"]
+    assert digest["param_types"] == ["&[u8]"]
+    assert "param_types" not in functions["sha2.Sha512.new"]
+    assert {"python": "Sha512", "rust": "sha2::Sha512"} in toml["mappings"]["types"]
+
+
+def test_rust_type_to_python_sanitizes_before_direct_lookup() -> None:
+    """Table keys are only matched after sanitizing, so lifetimes still fall back to object."""
+    assert rust_type_to_python("&'staticstr") == "object"
+    assert rust_type_to_python("&'static str") == "str"
+    assert rust_type_to_python(" u64 ") == "int"
+    assert rust_type_to_python("()") == "None"
+
+
+def test_format_rust_imports_dedupes_in_order() -> None:
+    """Duplicate rust_imports are dropped without reordering the rest."""
+    assert format_rust_imports(None) == "rust_imports = []"
+    assert format_rust_imports(("b::B", "a::A", "b::B")) == 'rust_imports = ["b::B", "a::A"]'
+
+
+def test_escape_toml_string_round_trips() -> None:
+    """Escaped rust_code parses back to the original value."""
+    value = 'println!("{}\\n", {arg0})'
+    parsed = tomllib.loads(f'rust_code = "{escape_toml_string(value)}"')
+    assert parsed["rust_code"] == value
 
 
 def test_actix_route_passthrough_attribute_adds_cargo_dependency() -> None: